@@ -20,13 +20,21 @@ import os
 import sys
 import argparse
 import re
+import json
+import hashlib
 import requests
-from urllib.parse import urlparse, parse_qs
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, urlsplit, urljoin, parse_qs, parse_qsl
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 import subprocess
 import shutil
 import time
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Optional: gdown (better for Google Drive large files). If not installed, the script will try to use requests.
 try:
@@ -35,6 +43,28 @@ try:
 except Exception:
     HAS_GDOWN = False
 
+# Optional: aiohttp + aiofiles (concurrent direct downloads). If not installed, downloads run one at a time.
+try:
+    import aiohttp
+    import aiofiles
+    HAS_AIOHTTP = True
+except Exception:
+    HAS_AIOHTTP = False
+
+# Optional: lxml (incremental parsing while the page downloads), else selectolax (fast C parser
+# for anchor extraction). Without either, BeautifulSoup with the pure-Python html.parser is used.
+try:
+    from lxml import etree
+    HAS_LXML = True
+except Exception:
+    HAS_LXML = False
+
+try:
+    from selectolax.parser import HTMLParser
+    HAS_SELECTOLAX = True
+except Exception:
+    HAS_SELECTOLAX = False
+
 # List of pages to probe for download links (official project & GitHub)
 PROJECT_PAGES = [
     "https://cse.buffalo.edu/~siweilyu/celeb-deepfakeforensics.html",  # official project page
@@ -46,18 +76,68 @@ PROJECT_PAGES = [
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) downloader-celebdf/1.0"}
 
+# Shared session: keep-alive + connection pooling so repeat hosts skip the TCP/TLS handshake.
+# Transient failures (rate limits, 5xx) are retried with backoff instead of failing the run.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+# On-disk cache of scraped page links (skip HTTP + parsing on repeat runs)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "celebdf-downloader")
+CACHE_TTL = 6 * 3600  # seconds; override with --cache-ttl
+USE_CACHE = True      # disable with --no-cache
+FORCE = False         # re-download files already on disk (--force)
+
+# Politeness: minimum spacing between starting two downloads from the same host
+MIN_HOST_INTERVAL = 1.0  # seconds
+_last_host_hit = {}
+_last_host_lock = threading.Lock()
+
+# Precompiled patterns for the per-URL hot paths
+_DRIVE_ID_RE = re.compile(r"/d/([a-zA-Z0-9_-]+)")
+# one pass per URL for all candidate heuristics: file extensions, Drive/Dropbox/Kaggle/Baidu, cloud hosts
+_CAND_RE = re.compile(
+    r"\.(?:zip|tar\.gz|tar|7z|mp4|mkv|bin|tgz|tar\.bz2)$"
+    r"|drive\.google\.com|kaggle\.com|dropbox\.com|pan\.baidu\.com"
+    r"|s3\.amazonaws\.com|storage\.googleapis\.com|box\.com",
+    re.IGNORECASE,
+)
+
 # --- utilities -------------------------------------------------------------
 
 def safe_mkdir(path):
     os.makedirs(path, exist_ok=True)
     return path
 
+def host_delay(url):
+    """
+    Reserve the next start slot for url's host and return how many seconds to wait for it.
+    Different hosts never wait on each other; thread-safe, so pools can share it.
+    """
+    host = urlparse(url).netloc
+    with _last_host_lock:
+        now = time.monotonic()
+        start = max(now, _last_host_hit.get(host, float("-inf")) + MIN_HOST_INTERVAL)
+        _last_host_hit[host] = start
+    return start - now
+
+def wait_for_host(url):
+    delay = host_delay(url)
+    if delay > 0:
+        time.sleep(delay)
+
 def is_google_drive(url):
     return "drive.google.com" in url or "docs.google.com" in url
 
 def extract_drive_id(url):
     # common patterns for Drive file: /file/d/<id>/ or ?id=<id>
-    m = re.search(r"/d/([a-zA-Z0-9_-]+)", url)
+    m = _DRIVE_ID_RE.search(url)
     if m:
         return m.group(1)
     qs = parse_qs(urlparse(url).query)
@@ -69,34 +149,133 @@ def download_with_gdown(drive_id, out_path):
     if not HAS_GDOWN:
         raise RuntimeError("gdown not installed. Install with: pip install gdown")
     url = f"https://drive.google.com/uc?id={drive_id}"
-    # gdown supports output path and resume
+    # gdown supports output path and resume; a path ending in os.sep is a folder and gdown
+    # names the file itself. The uc?id= URL is already canonical, so fuzzy matching is not needed.
     print(f"gdown -> {url} -> {out_path}")
-    gdown.download(url, out=out_path, quiet=False, fuzzy=True)
+    return gdown.download(url, output=out_path, quiet=False)
+
+class _ProgressReader:
+    """Wrap a raw response stream so each read() also updates a tqdm bar and a hash."""
+    def __init__(self, raw, pbar, hasher=None):
+        self.raw = raw
+        self.pbar = pbar
+        self.hasher = hasher
+
+    def read(self, size=-1):
+        buf = self.raw.read(size)
+        if self.hasher:
+            self.hasher.update(buf)
+        if self.pbar:
+            self.pbar.update(len(buf))
+        return buf
+
+def new_sha256(resume_path=None):
+    # hash the bytes already on disk when resuming, so the digest covers the whole file
+    if not resume_path:
+        return hashlib.sha256()
+    with open(resume_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256")
+        h = hashlib.sha256()
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+        return h
+
+def write_sha256(out_path, hasher):
+    # sidecar for integrity checks: "<digest>  <name>", as written by sha256sum
+    with open(out_path + ".sha256", "w") as f:
+        f.write(f"{hasher.hexdigest()}  {os.path.basename(out_path)}\n")
+
+def _threaded_copy(src, f, chunk_size, depth=8):
+    """
+    Copy src to f with disk writes on a background thread, so the socket keeps being
+    drained while a slow disk (USB, NFS) is busy. At most `depth` chunks are buffered.
+    """
+    q = queue.Queue(maxsize=depth)
+    errors = []
+
+    def writer():
+        while (buf := q.get()) is not None:
+            if errors:
+                continue  # keep draining so the reader never blocks on a full queue
+            try:
+                f.write(buf)
+            except Exception as e:
+                errors.append(e)
 
-def stream_download(url, out_path, chunk_size=32768):
+    t = threading.Thread(target=writer, daemon=True)
+    t.start()
+    try:
+        while not errors and (buf := src.read(chunk_size)):
+            q.put(buf)
+    finally:
+        q.put(None)
+        t.join()
+    if errors:
+        raise errors[0]
+
+def server_accepts_ranges(url):
+    # HEAD the URL to see whether the server advertises byte-range support
+    try:
+        r = SESSION.head(url, allow_redirects=True, timeout=15)
+        return r.headers.get("Accept-Ranges", "").lower() == "bytes"
+    except Exception:
+        return False
+
+def stream_download(url, out_path, chunk_size=1 << 20, resume=False):
     # Use requests to stream download. Fallback for direct links.
-    with requests.get(url, stream=True, headers=HEADERS, timeout=30) as r:
+    # With resume=True a partial file is continued with a Range request when possible;
+    # the caller decides, since only a partial file of this same URL may be continued.
+    resume_from = os.path.getsize(out_path) if resume and os.path.exists(out_path) else 0
+    headers = {}
+    if resume_from and server_accepts_ranges(url):
+        # ranges refer to the stored bytes, so ask for them unencoded
+        headers = {"Range": f"bytes={resume_from}-", "Accept-Encoding": "identity"}
+        if read_etag(out_path):
+            headers["If-Range"] = read_etag(out_path)  # changed remote -> full 200 body, not a bad splice
+    with SESSION.get(url, stream=True, headers=headers, timeout=30) as r:
+        if headers and r.status_code == 416:
+            print(f"{out_path} already complete ({resume_from} bytes)")
+            return
         r.raise_for_status()
+        if r.status_code == 206:
+            print(f"Resuming {os.path.basename(out_path)} from byte {resume_from}")
+            mode, initial = "ab", resume_from
+        else:
+            mode, initial = "wb", 0
+        write_etag(out_path, r.headers.get("ETag"))
         total = r.headers.get('content-length')
         if total is not None:
-            total = int(total)
-            pbar = tqdm(total=total, unit='B', unit_scale=True, desc=os.path.basename(out_path))
+            total = int(total) + initial
+            pbar = tqdm(total=total, initial=initial, unit='B', unit_scale=True, desc=os.path.basename(out_path))
         else:
             pbar = None
-        with open(out_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=chunk_size):
-                if not chunk:
-                    continue
-                f.write(chunk)
-                if pbar:
-                    pbar.update(len(chunk))
+        # SHA-256 is computed inline while the data is in memory, avoiding a second pass over the file
+        hasher = new_sha256(out_path if mode == "ab" else None)
+        # read 1 MiB blocks straight from the urllib3 stream; writes overlap on a background thread
+        r.raw.decode_content = True
+        with open(out_path, mode) as f:
+            _threaded_copy(_ProgressReader(r.raw, pbar, hasher), f, chunk_size)
         if pbar:
             pbar.close()
+        write_sha256(out_path, hasher)
+
+def maybe_aria2c(url, out_path, resume=False):
+    # Prefer aria2c if available: up to 16 parallel range connections per file, which
+    # helps on mirrors that throttle each connection. Resumes partial files like wget -c.
+    if shutil.which("aria2c"):
+        cmd = ["aria2c", "-x", "16", "-s", "16", "-k", "1M",
+               "--continue=true" if resume else "--allow-overwrite=true",
+               "--dir", os.path.dirname(out_path) or ".", "--out", os.path.basename(out_path), url]
+        print("Using aria2c:", " ".join(cmd))
+        subprocess.check_call(cmd)
+        return True
+    return False
 
-def maybe_wget(url, out_path):
+def maybe_wget(url, out_path, resume=False):
     # Try wget CLI if available; it handles redirections and large files well.
     if shutil.which("wget"):
-        cmd = ["wget", "-c", url, "-O", out_path]
+        cmd = ["wget"] + (["-c"] if resume else []) + [url, "-O", out_path]
         print("Using wget:", " ".join(cmd))
         subprocess.check_call(cmd)
         return True
@@ -104,74 +283,264 @@ def maybe_wget(url, out_path):
 
 # --- scraping -------------------------------------------------------------
 
+def _page_cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+def load_cached_page(url):
+    try:
+        with open(_page_cache_path(url)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def is_fresh_cache_entry(entry):
+    # entries without "candidates" come from an older version that stored every link
+    return bool(entry) and "candidates" in entry and time.time() - entry.get("fetched", 0) < CACHE_TTL
+
+def save_cached_page(url, r, links):
+    entry = {
+        "url": url,
+        "fetched": time.time(),
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "candidates": links,
+    }
+    path = _page_cache_path(url)
+    try:
+        safe_mkdir(CACHE_DIR)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Could not write page cache for {url}: {e}")
+
+def _is_candidate(u):
+    """
+    Heuristics: True for links that look like files, Google Drive, Dropbox, Kaggle, or big-host URLs.
+    """
+    if _CAND_RE.search(u):
+        return True
+    # long query-based links sometimes are downloads
+    if "?" not in u:
+        return False
+    lower = u.lower()
+    return len(urlparse(u).query) > 20 and ("download" in lower or "id=" in lower)
+
+def _resolve_href(base_url, origin, href):
+    # fast paths for absolute and root-relative hrefs skip re-parsing base_url per anchor
+    if href.startswith(("https://", "http://")):
+        return href
+    if href.startswith("/") and not href.startswith("//"):
+        return origin + href
+    return urljoin(base_url, href)
+
+def _drain_anchor_hrefs(parser):
+    for _, elem in parser.read_events():
+        href = elem.get("href")
+        elem.clear()  # processed: drop children/text to bound memory on large pages
+        if href:
+            yield href
+
+def iter_hrefs(r):
+    """
+    Yield the href of every <a> tag in a streamed response. With lxml the page is parsed
+    chunk by chunk as it arrives, so extraction finishes right after the last byte.
+    """
+    if HAS_LXML:
+        parser = etree.HTMLPullParser(events=("end",), tag="a")
+        for chunk in r.iter_content(8192):
+            parser.feed(chunk)
+            yield from _drain_anchor_hrefs(parser)
+        try:
+            parser.close()
+        except etree.LxmlError:
+            pass  # empty or hopelessly broken document: keep what was found
+        yield from _drain_anchor_hrefs(parser)
+    elif HAS_SELECTOLAX:
+        for node in HTMLParser(r.text).css("a[href]"):
+            yield node.attributes.get("href") or ""
+    else:
+        soup = BeautifulSoup(r.text, "html.parser")
+        for a in soup.find_all("a", href=True):
+            yield a["href"]
+
 def find_links_on_page(url):
     """
-    Return list of discovered links (absolute URLs) from the page.
+    Return sorted candidate download links (absolute URLs) found on the page.
+    Anchors are resolved and filtered in one pass, so non-candidate links are never collected.
     """
+    cached = load_cached_page(url) if USE_CACHE else None
+    if cached and "candidates" not in cached:
+        cached = None  # entry from an older version that stored every link
+    if is_fresh_cache_entry(cached):
+        print(f"Using cached links for: {url}")
+        return cached["candidates"]
+
+    # stale cache entry: revalidate, a 304 lets us reuse the stored links without parsing
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
     print(f"Fetching page: {url}")
+    base = urlsplit(url)
+    origin = f"{base.scheme}://{base.netloc}"
+    links = set()
     try:
-        r = requests.get(url, headers=HEADERS, timeout=20)
-        r.raise_for_status()
+        with SESSION.get(url, headers=headers, timeout=20, stream=True) as r:
+            r.raise_for_status()
+
+            if r.status_code == 304 and cached:
+                print(f"Not modified, reusing cached links for: {url}")
+                save_cached_page(url, r, cached["candidates"])
+                return cached["candidates"]
+
+            for href in iter_hrefs(r):
+                href = href.strip()
+                # ignore mailto and javascript anchors
+                if href.startswith("mailto:") or href.startswith("javascript:"):
+                    continue
+                # resolve relative links
+                abs_link = _resolve_href(url, origin, href)
+                if _is_candidate(abs_link):
+                    links.add(abs_link)
     except Exception as e:
         print(f"Failed to fetch {url}: {e}")
         return []
-
-    soup = BeautifulSoup(r.text, "html.parser")
-    links = set()
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        # ignore mailto and javascript anchors
-        if href.startswith("mailto:") or href.startswith("javascript:"):
-            continue
-        # resolve relative links
-        abs_link = requests.compat.urljoin(url, href)
-        links.add(abs_link)
-    return sorted(links)
-
-def filter_candidate_download_links(links):
-    """
-    Heuristics: keep links that look like files, Google Drive, Dropbox, Kaggle, or big-host URLs.
-    """
-    candidates = []
-    for u in links:
-        lower = u.lower()
-        # file extension heuristics
-        if re.search(r"\.(zip|tar\.gz|tar|7z|mp4|mkv|bin|tgz|tar\.bz2)$", lower):
-            candidates.append(u)
-            continue
-        # google drive / dropbox / kaggle
-        if "drive.google.com" in lower or "kaggle.com" in lower or "dropbox.com" in lower or "pan.baidu.com" in lower:
-            candidates.append(u)
-            continue
-        # common cloud hosts (aws s3, storage.googleapis)
-        if "s3.amazonaws.com" in lower or "storage.googleapis.com" in lower or "box.com" in lower:
-            candidates.append(u)
-            continue
-        # long query-based links sometimes are downloads
-        if len(urlparse(u).query) > 20 and ("download" in lower or "id=" in lower):
-            candidates.append(u)
-            continue
-    return sorted(set(candidates))
+    links = sorted(links)
+    if USE_CACHE:
+        save_cached_page(url, r, links)
+    return links
 
 # --- orchestrator --------------------------------------------------------
 
 def discover_download_links(pages=PROJECT_PAGES):
-    found = {}
-    for p in pages:
-        links = find_links_on_page(p)
-        cand = filter_candidate_download_links(links)
-        found[p] = cand
+    # pages live on independent hosts, so fetch them in parallel (I/O bound)
+    # pre-seed the dict so the summary keeps the PROJECT_PAGES order
+    found = {p: [] for p in pages}
+    if not pages:
+        return found
+    with ThreadPoolExecutor(max_workers=min(8, len(pages))) as ex:
+        futs = {ex.submit(find_links_on_page, p): p for p in pages}
+        for fut in as_completed(futs):
+            found[futs[fut]] = fut.result()
     return found
 
-def try_download_link(url, outdir):
+def output_path_for(url, outdir):
+    if is_google_drive(url):
+        drive_id = extract_drive_id(url)
+        if drive_id:
+            # Drive paths end in /view, /open, /uc...: give each file id its own folder
+            # and let gdown name the file inside it
+            return os.path.join(outdir, f"gdrive-{drive_id}")
+    parsed = urlsplit(url)
+    filename = parsed.path.rsplit("/", 1)[-1] or "downloaded_file"
+    # if query suggests a filename, prefer that (only parse the query when it can contain one)
+    q = parsed.query
+    if "filename=" in q:
+        for key, value in parse_qsl(q):
+            if key == "filename":
+                filename = value
+                break
+    return os.path.join(outdir, filename)
+
+def _owner_path(out_path):
+    return out_path + ".url"
+
+def written_by(out_path, url):
+    # True if out_path was (partially) written by a download of this exact URL
+    try:
+        with open(_owner_path(out_path)) as f:
+            return f.read().strip() == url
+    except OSError:
+        return False
+
+def claim_output(out_path, url):
+    # record which URL writes out_path, so only that URL may later resume or skip it
+    with open(_owner_path(out_path), "w") as f:
+        f.write(url + "\n")
+    # the file is about to change: an old digest would be wrong, and aria2c/wget write none
+    # (the requests/aiohttp paths write a fresh one when they finish)
+    if os.path.exists(out_path + ".sha256"):
+        os.remove(out_path + ".sha256")
+
+def _split_ext(path):
+    lower = path.lower()
+    for ext in (".tar.gz", ".tar.bz2"):
+        if lower.endswith(ext):
+            return path[:-len(ext)], path[-len(ext):]
+    return os.path.splitext(path)
+
+def assign_output_paths(urls, outdir):
+    """
+    Map each URL to its output path. URLs that would share a filename (e.g. data.zip on two
+    mirrors) get a short hash of the URL appended, so no two downloads ever write one file.
+    """
+    paths = {}
+    taken = set()
+    for url in urls:
+        path = output_path_for(url, outdir)
+        if path in taken:
+            root, ext = _split_ext(path)
+            path = f"{root}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]}{ext}"
+        taken.add(path)
+        paths[url] = path
+    return paths
+
+def read_etag(out_path):
+    try:
+        with open(out_path + ".etag") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def write_etag(out_path, etag):
+    # sidecar used by already_downloaded (and If-Range) to notice the remote file changing;
+    # written as soon as a download starts, so a partial file carries the ETag it belongs to
+    if etag:
+        with open(out_path + ".etag", "w") as f:
+            f.write(etag)
+    elif os.path.exists(out_path + ".etag"):
+        os.remove(out_path + ".etag")
+
+def already_downloaded(url, out_path):
+    """
+    True if out_path already holds the remote file: a successful HEAD reports the same
+    Content-Length as the local size and, when an .etag sidecar exists, the same ETag.
+    If the ETag changed, the file is left in place and simply downloaded again from scratch.
+    """
+    if FORCE or is_google_drive(url) or not os.path.exists(out_path):
+        return False  # a HEAD on a Drive link returns its HTML page, not the file
+    if os.path.exists(_owner_path(out_path)) and not written_by(out_path, url):
+        return False  # same name, but written by a different URL
+    try:
+        resp = SESSION.head(url, allow_redirects=True, timeout=15)
+        remote = int(resp.headers["content-length"])
+    except Exception:
+        return False  # unreachable, or no usable Content-Length
+    if not resp.ok or remote != os.path.getsize(out_path):
+        return False
+    etag = resp.headers.get("ETag")
+    stored = read_etag(out_path)
+    if etag and stored and stored != etag:
+        print(f"{out_path} changed on the server (ETag differs), downloading again")
+        # forget the ownership record so the next download rewrites instead of resuming
+        for sidecar in (_owner_path(out_path), out_path + ".etag"):
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+        return False
+    if etag and not stored:
+        write_etag(out_path, etag)
+    print(f"Skip, already downloaded: {out_path}")
+    return True
+
+def try_download_link(url, outdir, out_path=None, check_existing=True):
     safe_mkdir(outdir)
-    parsed = urlparse(url)
-    filename = os.path.basename(parsed.path) or "downloaded_file"
-    # if query suggests a filename, prefer that
-    qs = parse_qs(parsed.query)
-    if "filename" in qs:
-        filename = qs["filename"][0]
-    out_path = os.path.join(outdir, filename)
+    out_path = out_path or output_path_for(url, outdir)
+    if check_existing and already_downloaded(url, out_path):
+        return True
 
     # Google Drive handling
     if is_google_drive(url):
@@ -182,8 +551,9 @@ def try_download_link(url, outdir):
             return False
         try:
             if HAS_GDOWN:
-                download_with_gdown(drive_id, out_path)
-                return True
+                safe_mkdir(out_path)
+                # trailing separator: gdown saves under the file's own name in this folder
+                return bool(download_with_gdown(drive_id, out_path + os.sep))
             else:
                 print("gdown not installed. Try installing gdown to download from Google Drive.")
                 return False
@@ -191,21 +561,144 @@ def try_download_link(url, outdir):
             print(f"gdown failed: {e}")
             return False
 
+    # only continue a partial file that an earlier attempt at this same URL left behind
+    # (never with --force, or a finished file would just be reported complete again)
+    resume = not FORCE and os.path.exists(out_path) and written_by(out_path, url)
+    claim_output(out_path, url)
+
+    # Try aria2c CLI if available (segmented download)
+    try:
+        if maybe_aria2c(url, out_path, resume):
+            return True
+    except subprocess.CalledProcessError as e:
+        print("aria2c failed:", e)
+
     # Try wget CLI if available
     try:
-        if maybe_wget(url, out_path):
+        if maybe_wget(url, out_path, resume):
             return True
     except subprocess.CalledProcessError as e:
         print("wget failed:", e)
 
     # Finally try requests stream download
     try:
-        stream_download(url, out_path)
+        stream_download(url, out_path, resume=resume)
         return True
     except Exception as e:
         print(f"stream download failed for {url}: {e}")
         return False
 
+async def _adownload(session, url, out_path, sem):
+    # only continue a partial file that an earlier attempt at this same URL left behind
+    resume = not FORCE and os.path.exists(out_path) and written_by(out_path, url)
+    resume_from = os.path.getsize(out_path) if resume else 0
+    headers = {"Range": f"bytes={resume_from}-", "Accept-Encoding": "identity"} if resume_from else {}
+    if resume_from and read_etag(out_path):
+        headers["If-Range"] = read_etag(out_path)
+    try:
+        # wait for this host's slot before taking a semaphore slot, so links to other
+        # hosts are never stuck behind a queue of same-host links
+        await asyncio.sleep(host_delay(url))
+        async with sem:
+            async with session.get(url, headers=headers) as r:
+                if resume_from and r.status == 416:
+                    print(f"{out_path} already complete ({resume_from} bytes)")
+                    return True
+                r.raise_for_status()
+                # servers that ignore Range answer 200 with the full body: start over
+                mode = "ab" if r.status == 206 else "wb"
+                claim_output(out_path, url)
+                write_etag(out_path, r.headers.get("ETag"))
+                # hashing a multi-GB partial file must not block the other transfers
+                hasher = await asyncio.to_thread(new_sha256, out_path if mode == "ab" else None)
+                async with aiofiles.open(out_path, mode) as f:
+                    async for chunk in r.content.iter_chunked(1 << 16):
+                        hasher.update(chunk)
+                        await f.write(chunk)
+        write_sha256(out_path, hasher)
+        print(f"Downloaded {url} -> {out_path}")
+        return True
+    except Exception as e:
+        print(f"async download failed for {url}: {e}")
+        return False
+
+async def _adownload_all(paths, limit=8):
+    sem = asyncio.Semaphore(limit)
+    # cap connections per host to stay polite; starts are also spaced per host by host_delay
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=2)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(*[_adownload(session, u, path, sem) for u, path in paths.items()])
+
+def _polite_download(url, outdir, out_path):
+    # try_download_many has already run already_downloaded for every URL
+    wait_for_host(url)
+    return try_download_link(url, outdir, out_path, check_existing=False)
+
+def try_download_many(urls, outdir, drive_workers=4):
+    """
+    Download several URLs. Google Drive links run through gdown in a small thread pool.
+    Other links go one by one through try_download_link when aria2c is installed (it already
+    splits each file over 16 connections); otherwise they transfer concurrently with aiohttp
+    when available, which resumes partial files like wget -c. Links without either, and failed
+    async transfers, go through try_download_link (aria2c/wget/requests).
+    Returns a dict url -> bool.
+    """
+    safe_mkdir(outdir)
+    urls = list(dict.fromkeys(urls))  # same URL twice would race on one output file
+    # Drive links for the same file id (/file/d/<id>/view, open?id=<id>) are one download
+    drive_aliases = {}
+    first_by_id = {}
+    for url in urls:
+        drive_id = extract_drive_id(url) if is_google_drive(url) else None
+        if drive_id:
+            if drive_id in first_by_id:
+                drive_aliases[url] = first_by_id[drive_id]
+            else:
+                first_by_id[drive_id] = url
+    urls = [u for u in urls if u not in drive_aliases]
+    paths = assign_output_paths(urls, outdir)
+    results = {}
+    for url in urls:
+        if already_downloaded(url, paths[url]):
+            results[url] = True
+    urls = [u for u in urls if u not in results]
+    drive = [u for u in urls if is_google_drive(u)]
+    use_async = HAS_AIOHTTP and not shutil.which("aria2c")
+    direct = [u for u in urls if u not in drive] if use_async else []
+    serial = [u for u in urls if u not in drive and u not in direct]
+
+    # Drive throttles per connection, so several gdown transfers side by side fill the link;
+    # gdown blocks but releases the GIL on socket I/O. The pool size also caps connections to Drive.
+    with ThreadPoolExecutor(max_workers=drive_workers) as ex:
+        drive_futs = {ex.submit(_polite_download, u, outdir, paths[u]): u for u in drive}
+        if drive_futs:
+            print(f"Downloading {len(drive_futs)} Google Drive link(s) with up to {drive_workers} workers...")
+
+        if direct:
+            print(f"Downloading {len(direct)} direct link(s) concurrently...")
+            for url, ok in zip(direct, asyncio.run(_adownload_all({u: paths[u] for u in direct}))):
+                results[url] = ok
+                if not ok:
+                    serial.append(url)
+
+        for url in serial:
+            print(f"\n[*] Trying {url}")
+            results[url] = _polite_download(url, outdir, paths[url])
+            print(" ->", "OK" if results[url] else "FAILED")
+
+        for fut in as_completed(drive_futs):
+            url = drive_futs[fut]
+            try:
+                results[url] = fut.result()
+            except Exception as e:
+                print(f"Drive download error for {url}: {e}")
+                results[url] = False
+            print(f"[*] {url} ->", "OK" if results[url] else "FAILED")
+    for url, first in drive_aliases.items():
+        results[url] = results[first]
+    return results
+
 # --- main function -------------------------------------------------------
 
 def main(args):
@@ -215,8 +708,9 @@ def main(args):
     print("Discovering candidate download links on project pages...")
     discovered = discover_download_links()
 
-    # print summary for user to inspect
-    total = 0
+    # print summary for user to inspect; also remember which pages each link came from,
+    # so a link mirrored on several pages is only downloaded once
+    origins = {}
     for page, links in discovered.items():
         print("\n---\nFrom page:", page)
         if not links:
@@ -224,9 +718,9 @@ def main(args):
             continue
         for link in links:
             print("  ", link)
-            total += 1
+            origins.setdefault(link, set()).add(page)
 
-    if total == 0:
+    if not origins:
         print("\nNo direct download links discovered automatically. Please visit the official project page and follow instructions:")
         for p in PROJECT_PAGES:
             print("  -", p)
@@ -238,14 +732,12 @@ def main(args):
         return
 
     # Attempt downloads
-    print("\nAttempting to download discovered candidate links...\n")
-    for page, links in discovered.items():
-        for link in links:
-            print(f"\n[*] Trying {link}")
-            ok = try_download_link(link, outdir)
-            print(" ->", "OK" if ok else "FAILED")
-            # be polite and wait a bit to avoid hammering servers
-            time.sleep(1)
+    print(f"\nAttempting to download {len(origins)} unique candidate link(s)...\n")
+    for link, pages in origins.items():
+        if len(pages) > 1:
+            print(f"  {link} (listed on {len(pages)} pages)")
+    results = try_download_many(list(origins), outdir)
+    print(f"\n{sum(results.values())}/{len(results)} downloads succeeded.")
 
     print("\nDone. Check", outdir, "for downloaded files or error messages above.")
 
@@ -254,8 +746,15 @@ if __name__ == "__main__":
     parser.add_argument("--outdir", default="./downloads", help="Output directory for downloads")
     parser.add_argument("--dry-run", action="store_true", help="Only discover and list links; do not download")
     parser.add_argument("--direct", nargs='*', help="Optional direct URLs to download (skips discovery)")
+    parser.add_argument("--cache-ttl", type=float, default=6, help="Hours to reuse cached page links before refetching (default: 6)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the page link cache")
+    parser.add_argument("--force", action="store_true", help="Download again even if the file is already on disk")
     args = parser.parse_args()
 
+    CACHE_TTL = args.cache_ttl * 3600
+    USE_CACHE = not args.no_cache
+    FORCE = args.force
+
     if args.direct:
         # If direct URLs provided, try to download them
         for url in args.direct: